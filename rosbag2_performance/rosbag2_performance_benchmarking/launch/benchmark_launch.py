@@ -46,6 +46,7 @@ to benchmark folder.
 """
 
 import datetime
+import itertools
 import os
 import pathlib
 import shutil
@@ -60,6 +61,10 @@ import launch
 import launch_ros
 
 import yaml
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
 
 _bench_cfg_path = None
 _producers_cfg_path = None
@@ -108,8 +113,8 @@ def _copy_config_files():
     global _bench_cfg_path, _producers_cfg_path
     # Copy yaml configs for current benchmark after benchmark is finished
     benchmark_path = pathlib.Path(_producer_nodes[0]['parameters']['db_folder'])
-    shutil.copy(str(_bench_cfg_path), str(benchmark_path.with_name('benchmark.yaml')))
-    shutil.copy(str(_producers_cfg_path), str(benchmark_path.with_name('producers.yaml')))
+    shutil.copy(_bench_cfg_path, benchmark_path.with_name('benchmark.yaml'))
+    shutil.copy(_producers_cfg_path, benchmark_path.with_name('producers.yaml'))
 
 
 def _launch_sequence(transport):
@@ -196,8 +201,9 @@ def _producer_node_exited(event, context):
 
     # Handle clearing bag files
     if not node_params['preserve_bags']:
-        db_files = pathlib.Path.cwd().joinpath(node_params['db_folder']).glob('*.db3')
-        stats_path = pathlib.Path.cwd().joinpath(node_params['db_folder'], 'bagfiles_info.yaml')
+        db_folder = pathlib.Path.cwd() / node_params['db_folder']
+        db_files = db_folder.glob('*.db3')
+        stats_path = db_folder / 'bagfiles_info.yaml'
         stats = {
             'total_size': 0,
             'bagfiles': []
@@ -212,7 +218,7 @@ def _producer_node_exited(event, context):
 
         # Dump files size information
         with open(stats_path, 'w') as stats_file:
-            yaml.dump(stats, stats_file)
+            yaml.dump(stats, stats_file, Dumper=SafeDumper)
 
     # If we have non empty rosbag PID, then we need to kill it (end-to-end transport case)
     if _rosbag_pid is not None and transport:
@@ -252,7 +258,7 @@ def generate_launch_description():
     # Parse yaml config for benchmark
     bench_cfg = None
     with open(_bench_cfg_path, 'r') as config_file:
-        bench_cfg_yaml = yaml.load(config_file, Loader=yaml.FullLoader)
+        bench_cfg_yaml = yaml.load(config_file, Loader=SafeLoader)
         bench_cfg = (bench_cfg_yaml['rosbag2_performance_benchmarking']
                                    ['benchmark_node']
                                    ['ros__parameters'])
@@ -281,14 +287,17 @@ def generate_launch_description():
     params_cross_section = []
 
     # Generate unique benchmark directory name
-    benchmark_cfg_name = pathlib.Path(_bench_cfg_path).name.replace('.yaml', '')
-    producer_cfg_name = pathlib.Path(_producers_cfg_path).name.replace('.yaml', '')
+    benchmark_cfg_name = _bench_cfg_path.name.replace('.yaml', '')
+    producer_cfg_name = _producers_cfg_path.name.replace('.yaml', '')
     timestamp = datetime.datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
     transport_postfix = 'transport' if transport else 'no_transport'
-    benchmark_dir_name = benchmark_cfg_name + \
-        '_' + producer_cfg_name + \
-        '_' + transport_postfix + \
-        '_' + timestamp
+    benchmark_dir_name = '_'.join(
+        (benchmark_cfg_name, producer_cfg_name, transport_postfix, timestamp)
+    )
+    benchmark_path = pathlib.Path(db_root_folder, benchmark_dir_name)
+
+    # Result file path, same for all producers
+    result_file = benchmark_path / summary_result_file
 
     # Helper function for generating cross section list
     def __generate_cross_section_parameter(i,
@@ -324,17 +333,8 @@ def generate_launch_description():
                 bag_size=max_bag_size
             )
 
-        # Result file path for producer
-        result_file = pathlib.Path(db_root_folder).joinpath(
-            benchmark_dir_name,
-            summary_result_file
-        )
-
         # Database folder path for producer
-        db_folder = pathlib.Path(db_root_folder).joinpath(
-            benchmark_dir_name,
-            node_title
-        )
+        db_folder = benchmark_path / node_title
 
         # Filling up parameters cross section list for benchmark
         params_cross_section.append(
@@ -355,23 +355,15 @@ def generate_launch_description():
         )
 
     # For the sake of python indentation, multiple for loops in alternative way with helper func
-    [
-        __generate_cross_section_parameter(
-            i,
-            cache,
-            compression,
-            compression_queue_size,
-            compression_threads,
-            storage_config,
-            max_bag_size)
-        for i in range(0, repeat_each)
-        for cache in max_cache_size_params
-        for compression in compression_params
-        for compression_queue_size in compression_queue_size_params
-        for compression_threads in compression_threads_params
-        for storage_config in storage_config_file_params
-        for max_bag_size in max_bag_size_params
-    ]
+    for cross_section_parameters in itertools.product(
+            range(0, repeat_each),
+            max_cache_size_params,
+            compression_params,
+            compression_queue_size_params,
+            compression_threads_params,
+            storage_config_file_params,
+            max_bag_size_params):
+        __generate_cross_section_parameter(*cross_section_parameters)
 
     ld = launch.LaunchDescription()
     ld.add_action(
@@ -18,10 +18,41 @@
 
 import argparse
 import csv
+import itertools
 import pathlib
-import statistics
 
 import yaml
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+# Columns of results file used by postprocessing as integers
+_RESULTS_INTEGER_COLUMNS = (
+    'cache_size',
+    'max_bagfile_size',
+    'compression_queue',
+    'compression_threads',
+    'total_produced',
+    'total_recorded_count'
+)
+
+
+def _stats(samples):
+    """Calculate average, minimum and maximum of samples in a single pass."""
+    total = 0.0
+    minimum = maximum = samples[0]
+    for sample in samples:
+        total += sample
+        if sample < minimum:
+            minimum = sample
+        elif sample > maximum:
+            maximum = sample
+    return {
+        'avg': total / len(samples),
+        'min': minimum,
+        'max': maximum
+    }
 
 
 class Postprocess:
@@ -59,64 +90,58 @@ class PostprocessStorageConfig(Postprocess):
                                                        ['ros__parameters']
                                                        ['publishers'])
 
-        # Split data for storage configs
-        splitted_data = {}
-        for data in grouped_data:
-            storage_cfg_name = data[0]['storage_config']
-            storage_cfg_name = storage_cfg_name if storage_cfg_name != '' else 'default'
-            if storage_cfg_name not in splitted_data.keys():
-                splitted_data.update({storage_cfg_name: []})
-            splitted_data[storage_cfg_name].append(data)
+        publisher_groups_num = len(producers_config_publishers['publisher_groups'])
+
+        print(yaml.dump(producers_config_publishers, Dumper=SafeDumper))
+
+        # Calculate recorded messages ratio for each sample once, grouped by benchmark
+        # parameters, storage config and cache size
+        storage_cfg_names = {}
+        recorded_ratios = {}
+        for sample in grouped_data:
+            # Single sample contains multiple rows
+            if len(sample) != publisher_groups_num:
+                raise RuntimeError('Invalid number of records in results detected.')
 
-        cache_data_per_storage_conf = {}
+            # These parameters are same for all rows in sample
+            # (multiple publishers in publisher group)
+            first_row = sample[0]
+            storage_cfg_name = first_row['storage_config']
+            storage_cfg_name = storage_cfg_name if storage_cfg_name != '' else 'default'
+            storage_cfg_names.setdefault(storage_cfg_name)
+            test_parameters = (
+                first_row['compression'],
+                first_row['compression_queue'],
+                first_row['compression_threads'],
+                first_row['max_bagfile_size']
+            )
 
-        print(yaml.dump(producers_config_publishers))
+            # TODO(piotr.jaroszek) WARNING, currently results in 'total_produced' column
+            # are correct (per publisher group), but 'total_recorded' is already summed
+            # for all the publisher groups!
+            sample_total_produced = sum(row['total_produced'] for row in sample)
+            (recorded_ratios.setdefault(test_parameters, {})
+                            .setdefault(storage_cfg_name, {})
+                            .setdefault(first_row['cache_size'], [])
+                            .append(first_row['total_recorded_count']/sample_total_produced))
 
         def __process_test(compression_selected,
                            compression_queue_size_selected,
                            compression_threads_selected,
                            max_bagfile_size_selected):
-            for storage_cfg_name, data in splitted_data.items():
-                cache_samples = {}
-                for sample in data:
-                    # Single sample contains multiple rows
-                    if len(sample) != len(producers_config_publishers['publisher_groups']):
-                        raise RuntimeError('Invalid number of records in results detected.')
-
-                    # These parameters are same for all rows in sample
-                    # (multiple publishers in publisher group)
-                    if sample[0]['compression'] != compression_selected:
-                        continue
-                    if int(sample[0]['compression_queue']) != compression_queue_size_selected:
-                        continue
-                    if int(sample[0]['compression_threads']) != compression_threads_selected:
-                        continue
-                    if int(sample[0]['max_bagfile_size']) != max_bagfile_size_selected:
-                        continue
-
-                    if sample[0]['cache_size'] not in cache_samples.keys():
-                        cache_samples.update({sample[0]['cache_size']: []})
-
-                    # TODO(piotr.jaroszek) WARNING, currently results in 'total_produced' column
-                    # are correct (per publisher group), but 'total_recorded' is already summed
-                    # for all the publisher groups!
-                    sample_total_produced = 0
-                    for row in sample:
-                        sample_total_produced += int(row['total_produced'])
-                    cache_samples[sample[0]['cache_size']].append(
-                        int(sample[0]['total_recorded_count'])/sample_total_produced)
-
-                cache_recorded_percentage_stats = {
-                    cache: {
-                        'avg': statistics.mean(samples),
-                        'min': min(samples),
-                        'max': max(samples)
-                    }
-                    for cache, samples in cache_samples.items()
+            test_recorded_ratios = recorded_ratios.get(
+                (compression_selected,
+                 compression_queue_size_selected,
+                 compression_threads_selected,
+                 max_bagfile_size_selected),
+                {})
+            cache_data_per_storage_conf = {
+                storage_cfg_name: {
+                    cache: _stats(samples)
+                    for cache, samples in test_recorded_ratios.get(storage_cfg_name, {}).items()
                 }
-                cache_data_per_storage_conf.update(
-                    {storage_cfg_name: cache_recorded_percentage_stats}
-                )
+                for storage_cfg_name in storage_cfg_names
+            }
 
             result = {
                 'repeat_each': repeat_each,
@@ -140,22 +165,17 @@ class PostprocessStorageConfig(Postprocess):
                 print('\t\tstorage config: {}:'.format(pathlib.Path(storage_cfg).name))
                 for cache, percent_recorded in caches.items():
                     print('\t\t\tcache {:,} - min: {:.2%}, average: {:.2%}, max: {:.2%}'.format(
-                        int(cache),
+                        cache,
                         percent_recorded['min'],
                         percent_recorded['avg'],
                         percent_recorded['max']))
 
-        [
-            __process_test(
-                compression_selected,
-                compression_queue_size_selected,
-                compression_threads_selected,
-                max_bagfile_size_selected)
-            for compression_selected in benchmark_parameters['compression']
-            for compression_queue_size_selected in benchmark_parameters['compression_queue_size']
-            for compression_threads_selected in benchmark_parameters['compression_threads']
-            for max_bagfile_size_selected in benchmark_parameters['max_bag_size']
-        ]
+        for test_parameters in itertools.product(
+                benchmark_parameters['compression'],
+                benchmark_parameters['compression_queue_size'],
+                benchmark_parameters['compression_threads'],
+                benchmark_parameters['max_bag_size']):
+            __process_test(*test_parameters)
 
 
 class Report:
@@ -163,7 +183,7 @@ class Report:
 
     def __init__(self, benchmark_dir):
         """Initialize with config and results data."""
-        self.__benchmark_dir = benchmark_dir
+        self.__benchmark_dir = pathlib.Path(benchmark_dir)
         self.__load_configs()
         self.__load_results()
 
@@ -177,23 +197,25 @@ class Report:
         )
 
     def __load_configs(self):
-        producers_config_path = pathlib.Path(self.__benchmark_dir).joinpath('producers.yaml')
-        benchmark_config_path = pathlib.Path(self.__benchmark_dir).joinpath('benchmark.yaml')
+        producers_config_path = self.__benchmark_dir / 'producers.yaml'
+        benchmark_config_path = self.__benchmark_dir / 'benchmark.yaml'
 
         with open(producers_config_path, 'r') as fp:
-            self.__producers_config = yaml.load(fp, Loader=yaml.FullLoader)
+            self.__producers_config = yaml.load(fp, Loader=SafeLoader)
         with open(benchmark_config_path, 'r') as fp:
-            self.__benchmark_config = yaml.load(fp, Loader=yaml.FullLoader)
+            self.__benchmark_config = yaml.load(fp, Loader=SafeLoader)
 
     def __load_results(self):
-        results_path = pathlib.Path(self.__benchmark_dir).joinpath('results.csv')
+        results_path = self.__benchmark_dir / 'results.csv'
 
         with open(results_path, mode='r') as fp:
             reader = csv.DictReader(fp, delimiter=' ')
-            results = []
+            results = list(reader)
 
-            for result in reader:
-                results.append(result)
+            # Convert numeric columns once, so postprocessing compares plain integers
+            for row in results:
+                for column in _RESULTS_INTEGER_COLUMNS:
+                    row[column] = int(row[column])
 
             publishers_groups = (
                 self.__producers_config['rosbag2_performance_benchmarking_node']